@@ -1,17 +1,18 @@
 # flake8: noqa
 
 import os, sys, time, logging, logging.handlers, re, platform
+from collections import namedtuple
+from copy import deepcopy
+from itertools import count
 from pathlib import Path
-from functools import cached_property
+from functools import cached_property, lru_cache
 from enum import Enum
-from typing import Dict, Any, List, Iterable, Pattern, Tuple, Union
+from typing import Dict, Any, List, Iterable, Optional, Pattern, Tuple, Union
 from textwrap import dedent
 from getpass import getuser
 
 from loguru import Message, logger
-from rich.console import Console
 from ._vendor.platformdirs import PlatformDirs
-from ._vendor.decorator import decorate
 
 __version__ = '0.4.3'
 
@@ -21,23 +22,13 @@ logger.disable(__name__)
 
 def memoize(f):
     """
-    A simple memoize implementation. It works by adding a .cache dictionary
-    to the decorated function. The cache will grow indefinitely, so it is
-    your responsibility to clear it, if needed.
-    to clear: `memoized_function.cache = {}`
+    A simple memoize implementation, delegating to functools.lru_cache.
+    lru_cache is implemented in C, so cache hits cost a single dict probe
+    instead of a Python-level wrapper frame per call.
+    The cache will grow indefinitely, so it is your responsibility to clear
+    it, if needed. to clear: `memoized_function.cache_clear()`
     """
-    def _memoize(func, *args, **kw):
-        if kw:  # frozenset is used to ensure hashability
-            key = args, frozenset(kw.items())
-        else:
-            key = args
-        cache = func.cache  # attribute added by memoize
-        if key not in cache:
-            logger.trace(f"caching output of function `{func}` with arguments {args} and {kw}")
-            cache[key] = func(*args, **kw)
-        return cache[key]
-    f.cache = {}
-    return decorate(f, _memoize)
+    return lru_cache(maxsize=None)(f)
 
 def txt(s: str) -> str:
     """
@@ -52,6 +43,10 @@ def txt(s: str) -> str:
     """
     return dedent(s.lstrip("\n"))
 
+
+_CHOMP_RE = re.compile(r"(\n\n)|\n")
+
+
 def chomptxt(s: str) -> str:
     """
     dedents a triple-quoted indented string, and replaces all single newlines with spaces.
@@ -67,11 +62,16 @@ def chomptxt(s: str) -> str:
     into this:
     "hello world\nhere's another line"
     """
-    res = dedent(s)
-    res = res.replace("\n\n", "[PRESERVEDNEWLINE]")
-    res = res.replace("\n", " ")
-    res = res.replace("[PRESERVEDNEWLINE]", "\n")
-    return res.strip()
+    # one fused pass: double newlines collapse to single newlines, lone
+    # newlines become spaces. the old implementation made three full
+    # replace passes over the text (with a sentinel-string dance), each
+    # allocating a new copy of the string
+    return _CHOMP_RE.sub(lambda m: "\n" if m.group(1) else " ", dedent(s)).strip()
+
+
+# [^\S\n] is "any whitespace except newline", so surrounding \r/\f/\v get
+# trimmed just like str.strip() used to do
+_LST_RE = re.compile(r"^[^\S\n]*([^#\n]*?)[^\S\n]*(?:#.*)?$", re.M)
 
 
 def lst(s: str) -> List[str]:
@@ -88,15 +88,10 @@ def lst(s: str) -> List[str]:
     into this:
     ['hello', 'world']
     """
-    # dedent
-    s = txt(s)
-    # convert to list
-    list_ = s.splitlines()
-    # strip comments and surrounding whitespace
-    list_ = [line.partition("#")[0].strip() for line in list_]
-    # strip empty lines
-    list_ = list(filter(bool, list_))
-    return list_
+    # a single regex scan handles the splitting, comment stripping, and
+    # whitespace trimming that previously took three python-level passes
+    # (splitlines + partition/strip comprehension + filter)
+    return [line for line in _LST_RE.findall(txt(s)) if line]
 
 
 class Timeit:
@@ -150,7 +145,19 @@ class AtUtilsError(Exception):
 
 class InterceptHandler(logging.Handler):
     "This handler, when attached to the root logger of the python logging module, will forward all logs to Loguru's logger"
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        # frame-walk results per log call site. walking f_back chains is
+        # expensive, and the stack shape between a given call site and this
+        # handler doesn't change between emits
+        self._depth_cache: Dict[Tuple[str, str], int] = {}
+
     def emit(self, record):
+        # skip all the work below when loguru has no active sinks
+        # (the default state for libraries, per logger.disable below)
+        if not logger._core.handlers:  # type: ignore
+            return
+
         # Get corresponding Loguru level if it exists
         try:
             level = logger.level(record.levelname).name
@@ -158,10 +165,14 @@ class InterceptHandler(logging.Handler):
             level = record.levelno
 
         # Find caller from where originated the logged message
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
+        cache_key = (record.pathname, record.funcName)
+        depth = self._depth_cache.get(cache_key)
+        if depth is None:
+            frame, depth = logging.currentframe(), 2
+            while frame.f_code.co_filename == logging.__file__:
+                frame = frame.f_back
+                depth += 1
+            self._depth_cache[cache_key] = depth
 
         logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
 
@@ -175,9 +186,14 @@ class StrEnum(str, Enum):
     
     @classmethod
     def from_str(cls, string):
-        for member in cls:
-            if str(member) == string:
-                return member
+        # built lazily (members don't exist yet while the subclass body is
+        # executing) and stored per subclass, so lookups after the first
+        # are a single dict probe instead of a scan calling __str__ per member
+        name_map = cls.__dict__.get('_from_str_map_')
+        if name_map is None:
+            name_map = {str(member): member for member in cls}
+            cls._from_str_map_ = name_map
+        return name_map.get(string)
 
 
 class File(StrEnum):
@@ -186,29 +202,70 @@ class File(StrEnum):
     creatable = object()
     unusable = object()
 
+    # each of these probes costs a syscall (or several, for is_creatable), and
+    # config-file scans probe the same paths over and over. cache the results;
+    # Util._clear_caches (or File.clear_cache directly) resets them when file
+    # permissions are expected to have changed
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _probe(cls, f: Path) -> Tuple[bool, bool]:
+        """
+        derive (readable, writable) for f from a single os.stat, rather than
+        paying one os.access syscall (each a full LSM permission walk) per
+        question. falls back to os.access on platforms without POSIX uids
+        (ex. Windows).
+        """
+        try:
+            st = os.stat(f)
+        except OSError:
+            return False, False
+        if not hasattr(os, "geteuid"):
+            return os.access(f, os.R_OK), os.access(f, os.W_OK)
+        # pick the user/group/other permission triplet that applies to us
+        if st.st_uid == os.geteuid():
+            shift = 6
+        elif st.st_gid == os.getegid() or st.st_gid in os.getgroups():
+            shift = 3
+        else:
+            shift = 0
+        bits = st.st_mode >> shift
+        return bool(bits & 4), bool(bits & 2)
+
     @classmethod
     def is_writable(cls, f: Path):
-        return os.access(f, os.W_OK)
+        return cls._probe(f)[1]
 
     @classmethod
     def is_readable(cls, f: Path):
-        return os.access(f, os.R_OK)
+        return cls._probe(f)[0]
 
     @classmethod
+    @lru_cache(maxsize=None)
     def is_creatable(cls, f: Path):
-        # a file is createable if it doesn't exist and its parent directory is writable / creatable
-        try:
-            return (not f.exists()) and (cls.is_writable(f.parent) or cls.is_creatable(f.parent))
-        except PermissionError:
-            # f.exists() will fail if we don't have execute permission on the file's parent folder.
-            # when this happens, the file should be deemed uncreatable
+        # a file is createable if it doesn't exist and its nearest existing ancestor
+        # directory is writable. walk up the parents iteratively instead of recursing,
+        # and use os.path.lexists which is cheaper than Path.exists and returns False
+        # (rather than raising) when a parent folder denies us execute permission
+        if os.path.lexists(f):
             return False
+        for parent in f.parents:
+            if os.path.lexists(parent):
+                return cls.is_writable(parent)
+        return False
+
+    @classmethod
+    def clear_cache(cls):
+        "discard all cached file-state probes (ex. after file permissions have changed)"
+        cls._probe.cache_clear()
+        cls.is_creatable.cache_clear()
 
     @classmethod
     def state(cls, f: Path):
-        if cls.is_writable(f):
+        readable, writable = cls._probe(f)
+        if writable:
             return cls.writable
-        elif cls.is_readable(f):
+        elif readable:
             return cls.readable
         elif cls.is_creatable(f):
             return cls.creatable
@@ -216,6 +273,86 @@ class File(StrEnum):
             return cls.unusable
 
 
+# frozensets give O(1) membership checks in the config-file state filters
+# below, instead of allocating and linearly scanning a list per element
+_READABLE_STATES = frozenset({File.readable, File.writable})
+_WRITABLE_STATES = frozenset({File.writable})
+
+# result of one pass over the candidate config files: the full
+# (path, state) list plus the readable and writable path subsets
+_ConfigScan = namedtuple("_ConfigScan", ("all", "readable", "writable"))
+
+
+@lru_cache(maxsize=None)
+def _common_user_config_dir() -> Path:
+    "resolve the cross-platform user config dir once per process"
+    return Path.home() / '.config/at-utils'
+
+
+@lru_cache(maxsize=None)
+def _platform_dirs() -> PlatformDirs:
+    "PlatformDirs resolution is deterministic per process; build it once"
+    return PlatformDirs("at-utils")
+
+
+@lru_cache(maxsize=None)
+def _get_toml():
+    "import the vendored toml module once and reuse it"
+    from ._vendor import toml
+    return toml
+
+
+@lru_cache(maxsize=None)
+def _get_yaml():
+    "construct the (non-trivially expensive) safe YAML parser once and reuse it"
+    from ._vendor.yaml import YAML
+    return YAML(typ="safe")
+
+
+def _parse_ini(file: Path) -> Dict[str, Any]:
+    import configparser # noqa
+    cfp = configparser.ConfigParser()
+    cfp.read(file)
+    # hoist the _common_ section (if any) into the top level, then coerce
+    # the remaining sections in one pass instead of re-comparing section
+    # names in an explicit loop
+    obj: Dict[str, Any] = dict(cfp["_common_"]) if cfp.has_section("_common_") else {}
+    obj.update((sect, dict(cfp[sect])) for sect in cfp.sections() if sect != "_common_")
+    return obj
+
+
+def _parse_json(file: Path) -> Dict[str, Any]:
+    import json # noqa
+    # feed the parser from the open file instead of read_text() + loads,
+    # which buffers the whole document as an intermediate str first
+    with file.open("rb") as fp:
+        return dict(json.load(fp))
+
+
+def _parse_toml(file: Path) -> Dict[str, Any]:
+    with file.open("rb") as fp:
+        return dict(_get_toml().load(fp))
+
+
+def _parse_yaml(file: Path) -> Dict[str, Any]:
+    return dict(_get_yaml().load(file))
+
+
+_CONFIG_PARSERS = {
+    ".ini": _parse_ini,
+    ".json": _parse_json,
+    ".toml": _parse_toml,
+    ".yaml": _parse_yaml,
+}
+
+
+@lru_cache(maxsize=128)
+def _parse_config_file_cached(file: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # keyed on (path, mtime, size), so a changed file re-parses
+    # automatically while repeat reads of an unchanged file are free
+    return _CONFIG_PARSERS[file.suffix](file)
+
+
 class Util:
     """
     Core class for CLI apps to simplify access to config files, cache directories, and logging configuration
@@ -257,7 +394,9 @@ class Util:
                 serialize=True, # Convert {message} to a json string of the Message object
                 rotation="5MB", # How big should the log file get before it's rolled?
                 retention=4, # How many compressed copies to keep?
-                compression="zip"
+                compression="zip",
+                enqueue=True, # hand records to a background writer thread so
+                              # serialization + disk IO stay off the hot path
             )
             options.update(kwargs)
             logger.add(filename, **options)
@@ -307,13 +446,16 @@ class Util:
             # project for all your apps, and want to group all your alerts
             # into issues by app name
 
+            # bind the prefix once, instead of chasing self.parent.app_name
+            # and formatting an f-string for every event sent
+            prefix = f"{self.parent.app_name}: "
+
             def before_send(event, hint): # noqa
                 # group all sentry events by app name
                 if event.get("exception"):
-                    exc_type = event["exception"]["values"][0]["type"]
-                    event["exception"]["values"][0]["type"] = f"{self.parent.app_name}: {exc_type}"
-                if event.get("message"):
-                    event["message"] = f'{self.parent.app_name}: {event["message"]}'
+                    event["exception"]["values"][0]["type"] = prefix + event["exception"]["values"][0]["type"]
+                elif event.get("message"):
+                    event["message"] = prefix + event["message"]
                 return event
 
             sentry_sdk.init(
@@ -347,38 +489,62 @@ class Util:
 
     def __init__(self, app_name) -> None:
         self.app_name = app_name
-        self.dirs = PlatformDirs("at-utils")
-        self.common_user_config_dir = Path.home() / '.config/at-utils' 
-        self.console = Console(stderr=True)
+        # the set of candidate config file names never changes for a given
+        # app_name, so build the basename x extension cross-product once
+        # instead of re-formatting it for every directory scanned
+        self._file_names = tuple(
+            f"{basename}.{ext}"
+            for basename in ("shared", app_name)
+            for ext in ("ini", "yaml", "json", "toml")
+        )
+        # precomputed prefix for namespaced environment variable lookups,
+        # so get_env_var only has to uppercase the property name per call
+        self._env_prefix = f"{app_name}_".upper()
+        self.dirs = _platform_dirs()
+        self.common_user_config_dir = _common_user_config_dir()
         self.logging = self.Logging(self)
         # there should be one config path which is common to all OS platforms, 
         # so that users who sync configs betweeen multiple computers can sync 
         # those configs to the same directory across machines and have it *just work*
         # By convention, this path is ~/.config/at-utils
-        
-    
+
+    @cached_property
+    def console(self):
+        # constructed on first use: rich's import and Console's terminal
+        # capability probing are pure overhead for apps that never log
+        # through the stderr sink
+        from rich.console import Console # noqa
+        return Console(stderr=True)
+
     #region util
     def get_env_var(self, property):
         "fetches a namespaced environment variable"
         property = property.replace("-", "_")  # property names must have underscores, not dashes
-        env_var_name = f"{self.app_name}_{property}".upper()
+        env_var_name = self._env_prefix + property.upper()
         res = os.environ.get(env_var_name)
-        msg = f"Environment variable '{env_var_name}' for property '{property}'"
+        # leave message formatting to loguru, so no string work happens
+        # unless a sink actually accepts trace-level records
         if res:
-            logger.trace(f"{msg} is set to '{res}'")
+            logger.trace("Environment variable '{}' for property '{}' is set to '{}'", env_var_name, property, res)
         else:
-            logger.trace(f"{msg} is not set")
+            logger.trace("Environment variable '{}' for property '{}' is not set", env_var_name, property)
         return res
 
     def _clear_caches(self):
+        File.clear_cache()
+        _parse_config_file_cached.cache_clear()
         try:
-            del self.config_files
+            del self._config_scan
         except AttributeError:
             pass
         try:
             del self.merged_config_data
         except AttributeError:
             pass
+        try:
+            del self._config_object
+        except AttributeError:
+            pass
 
     #endregion util
     #region config
@@ -400,7 +566,7 @@ class Util:
         """
         # Site dirs
         if custom_site_config := self.get_env_var("site_config"):
-            logger.trace(f"Using {custom_site_config} as site config directory")
+            logger.trace("Using {} as site config directory", custom_site_config)
             yield Path(custom_site_config)
         else:
             yield self.dirs.site_config_path
@@ -409,7 +575,7 @@ class Util:
         yield self.common_user_config_dir
 
         if custom_user_config := self.get_env_var("user_config"):
-            logger.trace(f"Using {custom_user_config} as user config directory")
+            logger.trace("Using {} as user config directory", custom_user_config)
             yield Path(custom_user_config)
         elif (user_config := self.dirs.user_config_path) != self.common_user_config_dir:
             # yield user_config, but only if it's different than cross-platform user config
@@ -454,30 +620,38 @@ class Util:
             - (PosixPath('/Users/alex/Library/Preferences/at-utils/example.toml'), File.creatable)
 
         """
-        def file_names():
-            for basename in ['shared', self.app_name]:
-                for ext in ["ini", "yaml", "json", "toml"]:
-                    yield f"{basename}.{ext}"
-        
         for dir in self.config_dirs_generator():
-            for name in file_names():
+            for name in self._file_names:
                 file = dir / name
                 yield file, File.state(file)
 
 
     @cached_property
-    def config_files(self): 
-        res = list(self.config_files_generator())
+    def _config_scan(self) -> '_ConfigScan':
+        # one filesystem scan produces the full file list and both derived
+        # subsets, so repeated accesses to any of the three properties
+        # below never re-filter the list
+        res = tuple(self.config_files_generator())
         logger.bind(list=res).trace(f"Caching list of config files: ")
-        return res
+        readable, writable = [], []
+        for file, state in res:
+            if state in _READABLE_STATES:
+                readable.append(file)
+                if state is File.writable:
+                    writable.append(file)
+        return _ConfigScan(res, tuple(readable), tuple(writable))
+
+    @property
+    def config_files(self):
+        return self._config_scan.all
 
     @property
     def readable_config_files(self):
-        return [file for file, state in self.config_files if state in [File.readable, File.writable]]
+        return self._config_scan.readable
 
     @property
     def writable_config_files(self):
-        return [file for file, state in self.config_files if state == File.writable]
+        return self._config_scan.writable
 
     def get_config_file_or_fail(self):
         """
@@ -493,7 +667,7 @@ class Util:
             AtUtilsError: if no valid config file found
         """
         if custom_config_file := self.get_env_var("config_file"):
-            logger.trace(f"Skipping normal config file lookup, using {custom_config_file} as configuration file")
+            logger.trace("Skipping normal config file lookup, using {} as configuration file", custom_config_file)
             return Path(custom_config_file)
         # else:
         try:
@@ -502,7 +676,7 @@ class Util:
             # we want to grab the highest-priority file only.
             files = self.readable_config_files
             last_file = files[-1]
-            logger.trace(f"selecting config file {last_file} from available config files {files}")
+            logger.trace("selecting config file {} from available config files {}", last_file, files)
             return last_file
         except IndexError:
             raise AtUtilsError(chomptxt(f"""
@@ -511,33 +685,23 @@ class Util:
                 """))
 
     def parse_config_file(self, file: Path):
-        obj: Dict[str, Any]
-        if file.suffix == ".ini":
-            import configparser # noqa
-            cfp = configparser.ConfigParser()
-            cfp.read(file)
-            obj = dict(cfp["_common_"])
-            for sect in cfp.sections():
-                if sect != '_common_':
-                    obj[sect] = dict(cfp[sect])
-        elif file.suffix == ".json":
-            import json # noqa
-            obj = dict(json.loads(file.read_text()))
-        elif file.suffix == ".toml":
-            from ._vendor import toml
-            obj = dict(toml.loads(file.read_text()))
-        elif file.suffix == ".yaml":
-            from ._vendor.yaml import YAML
-            yaml = YAML(typ="safe")
-            obj = dict(yaml.load(file))
-        else:
+        parser = _CONFIG_PARSERS.get(file.suffix)
+        if parser is None:
             raise AtUtilsError(
-                chomptxt(f"""Failed to parse {file}. 
-                `{self.__class__.__name__}.parse_config_file()` 
+                chomptxt(f"""Failed to parse {file}.
+                `{self.__class__.__name__}.parse_config_file()`
                 does not support config files of type {file.suffix}.
                 Only .ini, .json, .toml, and .yaml files are supported""")
             )
-        return obj
+        try:
+            st = os.stat(file)
+        except OSError:
+            # unreadable/missing file: let the parser raise its own error
+            return parser(file)
+        # deep copy so callers can't mutate the cached object (even through
+        # nested sections); config files are small, so the parse is the
+        # expensive part, not the copy
+        return deepcopy(_parse_config_file_cached(file, st.st_mtime_ns, st.st_size))
 
     def get_config_object_or_fail(self):
         """
@@ -550,8 +714,15 @@ class Util:
         raises:
             AtUtilsError: if, somehow, the config file handed to this method has an invalid format
         """
+        return self._config_object
+
+    @cached_property
+    def _config_object(self) -> Dict[str, Any]:
+        # parsing the config file is by far the most expensive step in a
+        # key lookup, so the parsed dict is cached per instance and
+        # invalidated by _clear_caches
         conf_file = self.get_config_file_or_fail()
-        logger.debug(f"Loading config object from {conf_file}")
+        logger.debug("Loading config object from {}", conf_file)
         return self.parse_config_file(conf_file)
 
     def get_config_key_or_fail(self, key: str):
@@ -566,7 +737,7 @@ class Util:
             AtUtilsError: any exception raised by self.get_config_obj_or_fail
         """
         if custom_key := self.get_env_var(key):
-            logger.trace(f"Found environment variable override for config option {key}, using its value instead of pulling from config file")
+            logger.trace("Found environment variable override for config option {}, using its value instead of pulling from config file", key)
             return custom_key
         # else:
         obj = self.get_config_object_or_fail()
@@ -575,14 +746,14 @@ class Util:
         if not val:
             raise KeyError(f"Could not find key {key} in config object {obj}")
 
-        logger.debug(f"Found key {key} in config object")
+        logger.debug("Found key {} in config object", key)
         return val
 
     @cached_property
     def merged_config_data(self) -> Dict[str, Any]:
         data = {}
         for file in self.readable_config_files:
-            logger.debug(f"Loading config data from {file}")
+            logger.debug("Loading config data from {}", file)
             data.update(self.parse_config_file(file))
         return data
     #endregion config
@@ -604,7 +775,7 @@ class Util:
         # Site dir
         site_cache = self.dirs.site_data_path.joinpath(self.app_name)
         if custom_site_cache := self.get_env_var("site_cache"):
-            logger.trace(f"using {custom_site_cache} as site cache directory")
+            logger.trace("using {} as site cache directory", custom_site_cache)
             return Path(custom_site_cache)
         # else:
         try:
@@ -616,7 +787,7 @@ class Util:
         # User dir
         user_cache = self.dirs.user_cache_path.joinpath(self.app_name)
         if custom_user_cache := self.get_env_var("user_cache"):
-            logger.trace(f"using {custom_user_cache} as user cache directory")
+            logger.trace("using {} as user cache directory", custom_user_cache)
             return Path(custom_user_cache)
         # else:
         try:
@@ -638,15 +809,60 @@ class Util:
 
 #endregion logging
 
-        
+
+@lru_cache(maxsize=8192)
+def _safe_key(key: str) -> str:
+    "quote a dict key for use in a dotted keypath if it contains spaces"
+    # field names repeat heavily across records, so cache the quoting
+    # decision (and the quoted string) per distinct key
+    return f'"{key}"' if " " in key else key
+
+
+_INDEX_KEY_MATCH = re.compile(r'\[\d+\]\Z').match
+
+_STAR_RE = re.compile(r'\*')
+
+
+def _is_index_key(k: str) -> bool:
+    "test whether a keypath part looks like a list index (ex '[4]')"
+    # one C-level regex match instead of startswith + endswith + slice + isdecimal
+    return _INDEX_KEY_MATCH(k) is not None
+
+
+def _is_index_part(p) -> bool:
+    "test whether an internal keypath part denotes a list position (bare int tag or '[4]' string)"
+    return isinstance(p, int) or _INDEX_KEY_MATCH(p) is not None
+
+
 class NestedData:
     """
-    A collection of functions for working with nested data structures
+    A collection of functions for working with nested data structures.
+
+    Can also be instantiated with unstructured data (ex. the output of
+    `unstructure` / `remap` / `filter_`) to get a re-iterable handle on it.
+    Those functions return lazy generators, so iterating their output twice
+    silently yields nothing the second time; an instance of this class
+    materializes the stream exactly once, on first consumption, and can be
+    iterated any number of times after that.
     """
 
+    __slots__ = ('data', '_materialized')
+
     UnStructuredData = Iterable[Tuple[str, Any]]
     RegexOrString = Union[str, Pattern[str]]
 
+    def __init__(self, data: UnStructuredData) -> None:
+        self.data = data
+        self._materialized: Optional[List[Tuple[str, Any]]] = None
+
+    def _ensure_list(self) -> List[Tuple[str, Any]]:
+        if self._materialized is None:
+            self._materialized = list(self.data)
+        return self._materialized
+
+    def __iter__(self):
+        return iter(self._ensure_list())
+
     @classmethod
     def unstructure(cls, data: Any) -> UnStructuredData:
         """
@@ -664,34 +880,100 @@ class NestedData:
                 a list of 2-tuples representing "leaf node" elements 
                 from the datastructure, and their keypaths.
         """
-        if isinstance(data, list):
-            for index, item in enumerate(data):
-                keyname = f'[{index}]'
-                for keypath, value in cls.unstructure(item):
-                    if keypath:
-                        keypath = f'{keyname}.{keypath}'
-                    else:
-                        keypath = keyname
-                    yield keypath, value
-        elif isinstance(data, dict):
-            for key, item in data.items():
+        if type(data) is dict and not any(isinstance(v, (list, dict)) for v in data.values()):
+            # fast path for the very common flat dict-of-scalars payload:
+            # every value is already a leaf, so emit the tuples directly
+            # instead of spinning up the general-purpose walker
+            for key, value in data.items():
                 if not isinstance(key, str):
                     raise Exception("This function only supports dictionaries whose keys are strings")
-                if " " in key:
-                    # key contains spaces, and must be escaped
-                    keyname = f'"{key}"'
+                yield _safe_key(key), value
+            return
+        for parts, value in cls._unstructure_parts(data):
+            yield '.'.join(
+                part if isinstance(part, str) else f'[{part}]' for part in parts
+            ), value
+
+    @classmethod
+    def _unstructure_parts(cls, data: Any) -> Iterable[Tuple[tuple, Any]]:
+        """
+        The iterative walker behind `unstructure`. Yields (parts, value) tuples
+        where parts is a tuple of the individual keypath components, deferring
+        the '.'-join (and its string allocation) to whichever boundary needs
+        the dotted-string form. List positions are tagged with bare ints rather
+        than '[#]' strings, so consumers classify them with a single type check
+        instead of building and re-parsing bracket strings.
+        """
+        # Walk the structure depth-first with an explicit stack instead of recursing.
+        # The recursive version rebuilt the keypath string at every level on the way
+        # back up, so a leaf at depth D paid for D string concatenations. Here each
+        # stack entry carries the tuple of already-computed path components.
+        stack = [(data, ())]
+        while stack:
+            node, prefix = stack.pop()
+            if isinstance(node, list):
+                # push children in reverse so they pop back off in document order
+                stack.extend(
+                    (item, prefix + (index,))
+                    for index, item in reversed(list(enumerate(node)))
+                )
+            elif isinstance(node, dict):
+                children = []
+                for key, item in node.items():
+                    if not isinstance(key, str):
+                        raise Exception("This function only supports dictionaries whose keys are strings")
+                    children.append((item, prefix + (_safe_key(key),)))
+                stack.extend(reversed(children))
+            else:
+                # We've reached a leaf node in the data structure
+                yield prefix, node
+
+    @classmethod
+    def unstructure_many(cls, records: Iterable[Any]) -> Iterable[Tuple[int, str, Any]]:
+        """
+        Batch variant of `unstructure`. Takes an iterable of nested data
+        structures and yields (record_index, keypath, value) 3-tuples for every
+        leaf of every record. A single path buffer is reused (appended to and
+        popped in place) across all records, rather than re-entering
+        `unstructure` and allocating a fresh prefix per node per record.
+        """
+        _pop = object()  # sentinel: pop one component off the path buffer
+        buf: List[str] = []
+        for record_index, record in enumerate(records):
+            buf.clear()
+            stack = [(None, record)]
+            while stack:
+                entry = stack.pop()
+                if entry is _pop:
+                    buf.pop()
+                    continue
+                keyname, node = entry
+                if isinstance(node, list):
+                    if keyname is not None:
+                        buf.append(keyname)
+                        stack.append(_pop)
+                    stack.extend(
+                        (f'[{index}]', item)
+                        for index, item in reversed(list(enumerate(node)))
+                    )
+                elif isinstance(node, dict):
+                    if keyname is not None:
+                        buf.append(keyname)
+                        stack.append(_pop)
+                    children = []
+                    for key, item in node.items():
+                        if not isinstance(key, str):
+                            raise Exception("This function only supports dictionaries whose keys are strings")
+                        children.append((_safe_key(key), item))
+                    stack.extend(reversed(children))
                 else:
-                    keyname = key
-                for keypath, value in cls.unstructure(item):
-                    if keypath:
-                        keypath = f'{keyname}.{keypath}'
+                    if keyname is not None:
+                        buf.append(keyname)
+                        yield record_index, '.'.join(buf), node
+                        buf.pop()
                     else:
-                        keypath = keyname
-                    yield keypath, value
-        else:
-            # We've reached a leaf node in the data structure. return a falsy value as keypath so that previous 
-            # recursion uses its own keypath as the final keypath
-            yield "", data
+                        # the record itself is a leaf value
+                        yield record_index, '', node
 
     @classmethod
     def restructure(cls, data: UnStructuredData) -> Any:
@@ -701,54 +983,84 @@ class NestedData:
         and reconstructs a nested datastructure from that information
 
         Args:
-            data (List[Tuple[str, Any]]): 
-                a list of 2-tuples representing "leaf node" elements 
+            data (List[Tuple[str, Any]]):
+                a list of 2-tuples representing "leaf node" elements
                 from the datastructure, and their keypaths.
+                keypaths may be dotted strings (the `unstructure` format), or
+                already-split tuples of path components (the
+                `_unstructure_parts` format). The latter skips the per-keypath
+                string split entirely, so unstructure->restructure pipelines
+                that don't need the dotted-string form can pipe
+                `_unstructure_parts` output straight in.
 
         Returns:
             Union[dict, list]: 
                 The nested data structure, reconstructed. 
                 Can be a list or dict containing lists or dicts, to an almost infinite depth.
         """
-        
-
-        # The first thing we want to do is group items from the list based on the first element of their keypath. 
-        # All items sharing a common first element of a keypath belong to the same nested dict/list
-        root_names: Dict[str, Any] = {}
-        for keypath, value in data:
-            key, _, keypath = keypath.partition('.')
-
-            if key not in root_names:
-                root_names[key] = []
-            root_names[key].append((keypath, value))
-        
-        # Now, to reconstruct the object. The keys in root_names can either be all strings 
-        # (meaning this object is a dict), or they can all strings of the pattern '[#]' 
-        # representing list indices, or they can be blank, meaning we've reached "leaf nodes" in the data tree.
-        # in order to figure out which object to reconstruct, 
-        # we need to know what kind of keys we're dealing with
-        if len(root_names) == 1 and list(root_names.keys())[0] == '':
-            # We've reached a "leaf node"
-            return root_names[''][0][1]
-
-        def is_index_key(k: str) -> bool:
-            return k.startswith('[') and k.endswith(']') and k[1:-1].isdecimal()
-
-        if all([is_index_key(key) for key in root_names]):
-            # All keys match the pattern for index keys (numbers wrapped in square brackets)
-            result = []
-            for value in root_names.values():
-                r = cls.restructure(value)
-                result.append(r)
-        else:
-            # This is a dict
-            result = {}
-            for key, value in root_names.items():
-                r = cls.restructure(value)
-                result[key] = r
-        return result
+        # Pre-split every keypath into its parts exactly once and sort the stream
+        # by those parts (list indices compare numerically), so every group of
+        # tuples sharing a path prefix is contiguous. Rebuilding then only needs
+        # one linear itertools.groupby per level, instead of re-partitioning the
+        # remaining keypath tails into a fresh dict of lists at every level.
+        def part_sort_key(part):
+            if isinstance(part, int):
+                return (1, part)
+            if _is_index_key(part):
+                return (1, int(part[1:-1]))
+            return (0, part)
+
+        def sort_key(item):
+            return [part_sort_key(part) for part in item[0]]
+
+        items = sorted(
+            (
+                (keypath.split('.') if isinstance(keypath, str) else list(keypath), value)
+                for keypath, value in data
+            ),
+            key=sort_key,
+        )
+        if not items:
+            return []
+        first_parts = items[0][0]
+        if len(first_parts) == 0 or first_parts[0] == '':
+            # the whole stream is a single "leaf node" value
+            return items[0][1]
+
+        # rebuild the tree without recursion: walk the sorted stream once,
+        # keeping a stack of the currently-open containers (stack[d] is the
+        # container that parts at depth d get placed into). for each item, pop
+        # the containers that fall outside the common prefix with the previous
+        # item's path, open fresh dicts/lists for the unshared middle parts,
+        # then drop the leaf value into place.
+        root = [] if _is_index_part(first_parts[0]) else {}
+        stack: List[Any] = [root]
+        prev_parts: List[str] = []
+        for parts, value in items:
+            common = 0
+            max_common = min(len(parts), len(prev_parts)) - 1
+            while common < max_common and parts[common] == prev_parts[common]:
+                common += 1
+            del stack[common + 1:]
+            for i in range(common, len(parts) - 1):
+                # a container's type is decided by the shape of the key below it
+                child = [] if _is_index_part(parts[i + 1]) else {}
+                parent = stack[-1]
+                if isinstance(parent, list):
+                    parent.append(child)
+                else:
+                    parent[parts[i]] = child
+                stack.append(child)
+            parent = stack[-1]
+            if isinstance(parent, list):
+                parent.append(value)
+            else:
+                parent[parts[-1]] = value
+            prev_parts = parts
+        return root
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def _compile_keys_if_needed(cls, from_key: str, to_key: str = '') -> Tuple[RegexOrString, str]:
         new_key1, new_key2 = from_key, to_key
         if '*' in new_key1:
@@ -759,42 +1071,53 @@ class NestedData:
             # interpreted as regex symbols
             new_key1 = re.escape(new_key1).replace('\\*', '(.*)')
             new_key1 = re.compile(new_key1)
-            # we also need to convert to_key into a regex replace string (replace the '*' wildcard symbols 
+            # we also need to convert to_key into a regex replace string (replace the '*' wildcard symbols
             # with capture group backreferences '\#')
-            # this part's a little bit trickier, since each such instance must be enumerated and assigned an index
-            occurences = new_key2.count('*')
-            for i in range(occurences):
-                ref = i+1
-                new_key2 = new_key2.replace('*', f'\\{ref}', 1)
+            # each instance must be enumerated and assigned an index; a counter-driven
+            # re.sub does that in a single left-to-right pass, where the old
+            # replace-one-at-a-time loop rescanned the string from the start per wildcard
+            counter = count(1)
+            new_key2 = _STAR_RE.sub(lambda _: f'\\{next(counter)}', new_key2)
         return new_key1, new_key2
 
     @classmethod
     def remap(cls, data: UnStructuredData, key_map: List[Tuple[str, str]]) -> UnStructuredData:
-        result = list(data)
+        # compile the whole key map up front, then make a single fused pass over
+        # the stream, applying every substitution in order to each tuple as it
+        # goes by. the old implementation materialized the stream into a list
+        # and rewrote the entire list once per key-map entry.
+        # each op is a pre-bound key -> key callable applied strictly in
+        # key_map order, so chained renames cascade exactly as documented
+        # and the hot loop below is a monomorphic call per op with no
+        # per-row branch or unpacking
+        ops: List[Any] = []
         for from_key, to_key in key_map:
             from_key, to_key = cls._compile_keys_if_needed(from_key, to_key)
-            for index, tup in enumerate(result):
-                key, value = tup
-                if isinstance(from_key, Pattern): # noqa
-                    #do a regex substitution
-                    new_key = re.sub(from_key, to_key, key)
-                else:
-                    # do a regular substitution
-                    new_key = key.replace(from_key, to_key)
-                result[index] = new_key, value
-        return result
+            if isinstance(from_key, Pattern): # noqa
+                ops.append(lambda k, sub=from_key.sub, t=to_key: sub(t, k))
+            else:
+                ops.append(lambda k, f=from_key, t=to_key: k.replace(f, t))
+
+        for key, value in data:
+            for op in ops:
+                key = op(key)
+            yield key, value
 
     @classmethod
     def filter_(cls, data: UnStructuredData, key_list: List[str]) -> UnStructuredData:
-        def test(pattern, tup):
+        # pre-bind a match callable per filter pattern, so the hot loop below is
+        # a short-circuiting any() over tight closures, with no per-tuple
+        # isinstance dispatch and no throwaway list of match results
+        predicates = []
+        for key in key_list:
+            pattern = cls._compile_keys_if_needed(key)[0]
             if isinstance(pattern, Pattern): # noqa
-                return bool(re.match(pattern, tup[0]))
-            # else:
-            return bool(pattern in tup[0])
-        
-        filters_list = [cls._compile_keys_if_needed(key)[0] for key in key_list]
+                predicates.append(pattern.match)
+            else:
+                predicates.append(lambda s, p=pattern: p in s)
 
         for tup in data:
+            key = tup[0]
             # yield tup if it matches any of the filters
-            if any([test(pat, tup) for pat in filters_list]):
+            if any(predicate(key) for predicate in predicates):
                 yield tup
\ No newline at end of file
@@ -19,21 +19,32 @@ class PropogateHandler(logging.Handler):
         logging.getLogger(record.name).handle(record)
 
 
+_propogate_handler_installed = False
+
+
+def _install_propogate_handler():
+    # adding/removing a loguru sink rebuilds its handler table and
+    # recompiles the sink format, so do it once per session instead of
+    # once per test using the caplog fixture
+    global _propogate_handler_installed
+    if _propogate_handler_installed:
+        return
+    logger.remove() # remove default handler, if it exists
+    logger.enable("") # enable all logs from all modules
+    logging.addLevelName(5, "TRACE") # tell python logging how to interpret TRACE logs
+    logger.add(PropogateHandler(), format="{message} {extra}", level="TRACE") # shunt logs into the standard python logging machinery
+    _propogate_handler_installed = True
+
 
 @pytest.fixture
 def caplog(caplog):
     """
     override and wrap the caplog fixture with one of our own
     """
-    logger.remove() # remove default handler, if it exists
-    logger.enable("") # enable all logs from all modules
-    logging.addLevelName(5, "TRACE") # tell python logging how to interpret TRACE logs
-    class PropogateHandler(logging.Handler):
-        def emit(self, record):
-            logging.getLogger(record.name).handle(record)
-    logger.add(PropogateHandler(), format="{message} {extra}", level="TRACE") # shunt logs into the standard python logging machinery
+    _install_propogate_handler()
     caplog.set_level(0) # Tell logging to handle all log levels
     yield caplog
+    caplog.clear() # per-test isolation comes from clearing captured records
 
 
 
@@ -9,6 +9,8 @@ import platform
 
 from loguru import logger as log
 
+from ._vendor.platformdirs import user_log_dir
+
 log.disable("at_utils")
 
 STDERR_FORMAT = "<blue>{extra[app_name]}</> | <level>{level.name:8}</>| <bold>{message}</>"  # noqa
@@ -19,18 +21,32 @@ SYSLOG_FORMAT = "{extra[app_name]} | {name}:{function}:{line} - {level.name: ^8}
 
 DEFAULT_LOG_DIR = "/var/log/at-utils"
 
+# levelname -> loguru level name (or stdlib levelno for levels loguru
+# doesn't know about), resolved once per distinct levelname instead of a
+# lookup + exception dance per intercepted record
+_LEVEL_CACHE: dict = {}
+
+_LOGGING_FILE = logging.__file__
+
 
 class InterceptHandler(logging.Handler):
     def emit(self, record):
         # Get corresponding Loguru level if it exists
-        try:
-            level = log.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-
-        # Find caller from where originated the logged message
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
+        level = _LEVEL_CACHE.get(record.levelname)
+        if level is None:
+            try:
+                level = log.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            _LEVEL_CACHE[record.levelname] = level
+
+        # Find caller from where originated the logged message.
+        # sys._getframe is what logging.currentframe wraps; calling it
+        # directly skips a layer of dispatch on every record
+        frame, depth = sys._getframe(2), 2
+        while frame.f_code.co_filename == _LOGGING_FILE:
+            if frame.f_back is None:
+                break
             frame = frame.f_back
             depth += 1
 
@@ -104,18 +120,18 @@ def get_logfile_sink(app_name: str) -> Optional[Path]:
         log.debug("Env var DISABLE_FILE_LOGGING is set. File logging disabled.")
         return None
 
+    # resolve both candidate paths once; the retry path below used to
+    # rebuild them (including the user_log_dir platform lookup) per attempt
+    log_dir = os.environ.get("DEFAULT_LOG_DIR", DEFAULT_LOG_DIR)
+    if log_dir != DEFAULT_LOG_DIR:
+        log.debug(
+            "Env var DEFAULT_LOG_DIR is set. " "Will write to a log file in there"
+        )
+    main_log_file = Path(log_dir) / f"{app_name}.log"
+    backup_log_file = Path(user_log_dir(app_name)) / "output.log"
+
     def get_log_file(backup=False) -> Optional[Path]:
-        log_dir = os.environ.get("DEFAULT_LOG_DIR", DEFAULT_LOG_DIR)
-        if log_dir != DEFAULT_LOG_DIR:
-            log.debug(
-                "Env var DEFAULT_LOG_DIR is set. " "Will write to a log file in there"
-            )
-        main_log_file = Path(f"{log_dir}/{app_name}.log")
-        backup_log_file = Path(f"{user_log_dir(app_name)}/output.log")
-        if not backup:
-            log_file = main_log_file
-        else:
-            log_file = backup_log_file
+        log_file = backup_log_file if backup else main_log_file
 
         if log_file.is_file():
             log.debug(f"Found log file {log_file}. Will log messages to it")
@@ -3,12 +3,13 @@ This module stores a random assortment of functions and utilities which require
 additinal dependencies not included in 
 """
 
+import os
 import re
 import sys
+from collections import deque
 from subprocess import run, PIPE
 from pathlib import Path
 from types import ModuleType
-import inspect
 
 from . import memoize
 
@@ -32,16 +33,38 @@ def re_partition(regex: Pattern, s: str):
 
 
 def re_rpartition(regex: Pattern, s: str):
-    # find the last match, or None if not found
-    match = None
-    for match in regex.finditer(s):
-        pass
+    # find the last match, or None if not found.
+    # a maxlen-1 deque drains the match iterator in C, keeping only the
+    # final match, instead of spinning a python-level for/pass loop
+    last = deque(regex.finditer(s), maxlen=1)
+    match = last[0] if last else None
     if match:
         return s[:match.start()], s[slice(*match.span())], s[match.end():]
     # else:
     return ('', '', s)
 
 
+@memoize
+def _yaml_types():
+    "import the vendored yaml container types once and reuse them"
+    from ._vendor.yaml import CommentedMap, CommentedSeq
+    return CommentedMap, CommentedSeq
+
+
+@memoize
+def _yaml_dumps():
+    "import the vendored yaml dumper once and reuse it"
+    from ._vendor.yaml import dumps
+    return dumps
+
+
+@memoize
+def _model_field_type():
+    "import pydantic's ModelField once and reuse it"
+    from pydantic.fields import ModelField
+    return ModelField
+
+
 def get_comment(
         obj: Union['CommentedSeq', 'CommentedMap'], 
         key: Optional[Union[str, int]] = None
@@ -53,8 +76,7 @@ def get_comment(
     if no key is provided, fetch the comment associated with the object itself
     if no comment can be found, return None
     """
-    from ._vendor.yaml import CommentedMap, CommentedSeq, CommentToken
-    if not isinstance(obj, (CommentedMap, CommentedSeq)):
+    if not isinstance(obj, _yaml_types()):
         return None
     if key is None:
         comment_list = obj.ca.comment
@@ -67,10 +89,12 @@ def get_comment(
         # which of the 4 elements is the
         # CommentToken changes depending on... something?
         # so we'll jsut filter the list looking for the first comment token
-    comment_list = [token for token in comment_list if token]
-    comment_list = cast(Optional[List[CommentToken]], comment_list)
-    if comment_list:
-        return comment_list[0].value.partition('#')[2].strip()
+    # only the first comment token is ever used, so short-circuit to it
+    # instead of materializing a filtered list
+    first = next((token for token in comment_list if token), None)
+    first = cast(Optional['CommentToken'], first)
+    if first is not None:
+        return first.value.partition('#')[2].strip()
     # else:
     return None
 
@@ -95,8 +119,14 @@ def unflatten_yaml(data: Sequence[YamlValue]):
     raise NotImplementedError
 
 
+@memoize
+def _alias_line_pattern(indent: int, alias: str) -> Pattern:
+    "compiled patterns are reused across fields, models, and recursive calls"
+    return re.compile(fr'^ {{{indent}}}{alias}:.*$', re.MULTILINE)
+
+
 def add_comments_to_yaml_doc(doc: str, model: 'BaseModel', indent=0):
-    from pydantic.fields import ModelField
+    ModelField = _model_field_type()
     for field in model.fields.values():  # type: ignore
         field: ModelField
         desc = field.field_info.description
@@ -105,10 +135,7 @@ def add_comments_to_yaml_doc(doc: str, model: 'BaseModel', indent=0):
             # alias this description belongs to, all preceeding lines, and all
             # following lines. To do this, we're going to regex partition the
             # document
-            pattern = re.compile(
-                fr'^ {{{indent}}}{field.alias}:.*$',
-                re.MULTILINE
-            )
+            pattern = _alias_line_pattern(indent, field.alias)
             pre, match, rest = re_partition(pattern, doc)
             if len(desc) > 30:
                 indent_spc = indent * ' '
@@ -126,13 +153,19 @@ def add_comments_to_yaml_doc(doc: str, model: 'BaseModel', indent=0):
 
 
 def model_to_yaml(model: 'BaseModel'):
-    from ._vendor.yaml import dumps
-    doc = dumps(model.dict(by_alias=True))
+    doc = _yaml_dumps()(model.dict(by_alias=True))
     # Now to add in the comments.
     doc = add_comments_to_yaml_doc(doc, model)
     return doc
 
 
+def _atomic_write(path: Path, text: str):
+    "write to a sibling temp file, then atomically swap it into place"
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
 def bump_version():
     """
     bump a project's version number.
@@ -160,9 +193,14 @@ def bump_version():
                 " or ignore all outstanding files, then try again."
             )
             sys.exit(1)
-    pyproject = tomlkit.parse(Path("pyproject.toml").read_text())
+    # read both files up front, so any read error aborts before anything
+    # has been mutated on disk
+    pyproject_file = Path("pyproject.toml")
+    pyproject = tomlkit.parse(pyproject_file.read_text())
     package_name = pyproject["tool"]["poetry"]["name"]  # type: ignore
     old_version = pyproject["tool"]["poetry"]["version"]  # type: ignore
+    init_file = Path(f"{package_name}/__init__.py")
+    init_text = init_file.read_text()
     version = semver.VersionInfo.parse(old_version)
     # for every bump_type in the list above, there is a bump_{type} method
     # on the VersionInfo object. here we look up the method and call it
@@ -170,18 +208,19 @@ def bump_version():
     version = getattr(version, f"bump_{args.bump_type}")()
     new_version = str(version)
     pyproject["tool"]["poetry"]["version"] = new_version  # type: ignore
-    init_file = Path(f"{package_name}/__init__.py")
-    init_text = init_file.read_text()
-    ver_strings_in_init_text = list(filter(lambda l: '__version__ =' in l, init_text.splitlines()))
-    if len(ver_strings_in_init_text) > 0:
-        old_ver_string = ver_strings_in_init_text[0]
-        init_text = init_text.replace(
-            old_ver_string, f"__version__ = '{new_version}'"
-        )
+    # rewrite the version line in one multiline-regex pass, instead of
+    # splitlines + filter + a second full-text replace
+    init_text = re.sub(
+        r'^__version__\s*=.*$',
+        f"__version__ = '{new_version}'",
+        init_text,
+        count=1,
+        flags=re.MULTILINE,
+    )
 
     # no turning back now!
-    Path("pyproject.toml").write_text(tomlkit.dumps(pyproject))
-    init_file.write_text(init_text)
+    _atomic_write(pyproject_file, tomlkit.dumps(pyproject))
+    _atomic_write(init_file, init_text)
     run(["git", "add", "."], check=True)
     run(
         ["git", "commit", "-m", f"bump version from {old_version} to {new_version}"],
@@ -206,20 +245,18 @@ def clear_caches(module: ModuleType):
     and staticmethods of all classes in a given module
     """
 
-    def get_cachables():
-        # functions
-        for _, function_ in inspect.getmembers(module, inspect.isfunction):
-            yield function_
-
-        for _, class_ in inspect.getmembers(module, inspect.isclass):
-            # static methods
-            for _, static_method in inspect.getmembers(class_, inspect.isfunction):
-                yield static_method
-
-            # class methods
-            for _, class_method in inspect.getmembers(class_, inspect.ismethod):
-                yield class_method
-
-    for cacheable in get_cachables():
-        if hasattr(cacheable, "cache"):
-            cacheable.cache = {}
+    # iterate the namespace dicts directly: inspect.getmembers getattr's
+    # (and sorts) every attribute, which is slow and invokes descriptors.
+    # reading __dict__ sees the raw staticmethod/classmethod wrappers
+    # instead, which we unwrap without calling them
+    for obj in vars(module).values():
+        members = vars(obj).values() if isinstance(obj, type) else (obj,)
+        for member in members:
+            if isinstance(member, (staticmethod, classmethod)):
+                member = member.__func__
+            if not callable(member):
+                continue
+            if hasattr(member, "cache_clear"):
+                member.cache_clear()
+            elif hasattr(member, "cache"):
+                member.cache = {}
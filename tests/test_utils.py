@@ -1,5 +1,4 @@
 from pathlib import Path
-import time
 from typing import TYPE_CHECKING
 import logging
 from at import utils
@@ -235,7 +234,7 @@ class TestUtil:
         file = util.get_config_file_or_fail()
         assert file.exists()
 
-    def test_get_config_file_env_var(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture', caplog: 'LogCaptureFixture'):
+    def test_get_config_file_env_var(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture'):
         util, folders = mock_folders
         # test the *_CONFIG_FILE env var
         test_file = folders.root / "test.ini"
@@ -247,7 +246,7 @@ class TestUtil:
         assert result.exists()
         assert f"Skipping normal config file lookup, using {test_file} as configuration file"
 
-    def test_get_config_obj_ini(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture', caplog: 'LogCaptureFixture'):
+    def test_get_config_obj_ini(self, mock_folders: 'MockUtilFolders'):
         util, folders = mock_folders
         folders.user_config.ini_file.write_text(
             """
@@ -261,7 +260,7 @@ class TestUtil:
         result = util.get_config_object_or_fail()
         assert result == {"key1": "val1", "key2": "val2", "extra": {"key": "value"}}
 
-    def test_get_config_obj_json(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture', caplog: 'LogCaptureFixture'):
+    def test_get_config_obj_json(self, mock_folders: 'MockUtilFolders'):
         util, folders = mock_folders
         folders.user_config.json_file.write_text(
             """
@@ -274,7 +273,7 @@ class TestUtil:
         result = util.get_config_object_or_fail()
         assert result == {"key1": "val1", "key2": "val2"}
 
-    def test_get_config_obj_toml(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture', caplog: 'LogCaptureFixture'):
+    def test_get_config_obj_toml(self, mock_folders: 'MockUtilFolders'):
         util, folders = mock_folders
         folders.user_config.toml_file.write_text(
             """
@@ -285,7 +284,7 @@ class TestUtil:
         result = util.get_config_object_or_fail()
         assert result == {"key1": "val1", "key2": "val2"}
 
-    def test_get_config_obj_yaml(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture', caplog: 'LogCaptureFixture'):
+    def test_get_config_obj_yaml(self, mock_folders: 'MockUtilFolders'):
         util, folders = mock_folders
         folders.user_config.yaml_file.write_text(
             """
@@ -296,7 +295,7 @@ class TestUtil:
         result = util.get_config_object_or_fail()
         assert result == {"key1": "val1", "key2": "val2"}
 
-    def test_get_config_key(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture', caplog: 'LogCaptureFixture'):
+    def test_get_config_key(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture'):
         util, folders = mock_folders
 
         # test config file missing
@@ -321,7 +320,7 @@ class TestUtil:
         result = util.get_config_key_or_fail("key1")
         assert result == "env var value"
 
-    def test_get_cache_dir(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture', caplog: 'LogCaptureFixture'):
+    def test_get_cache_dir(self, mock_folders: 'MockUtilFolders'):
         util, folders = mock_folders
 
         # if both user and site caches exist, prefer site cache
@@ -329,7 +328,7 @@ class TestUtil:
         assert folders.user_cache.exists()
         assert util.cache_dir == folders.site_cache
 
-    def test_get_cache_dir_user(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture', caplog: 'LogCaptureFixture'):
+    def test_get_cache_dir_user(self, mock_folders: 'MockUtilFolders'):
         util, folders = mock_folders
 
         # if site cache is unavailable, return user cache
@@ -338,14 +337,14 @@ class TestUtil:
         assert folders.user_cache.exists()
         assert util.cache_dir == folders.user_cache
 
-    def test_get_cache_dir_site_env(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture', caplog: 'LogCaptureFixture'):
+    def test_get_cache_dir_site_env(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture'):
         util, folders = mock_folders
 
         # if both user and site caches exist, prefer site cache
         mocker.patch.dict("os.environ", {"EXAMPLE_APP_SITE_CACHE": folders.site_cache_env.__str__()})
         assert util.cache_dir == folders.site_cache_env
     
-    def test_get_cache_dir_user_env(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture', caplog: 'LogCaptureFixture'):
+    def test_get_cache_dir_user_env(self, mock_folders: 'MockUtilFolders', mocker: 'MockerFixture'):
         util, folders = mock_folders
 
         # if site cache is unavailable, return user cache
@@ -354,27 +353,25 @@ class TestUtil:
         mocker.patch.dict("os.environ", {"EXAMPLE_APP_SITE_CACHE": folders.user_cache_env.__str__()})
         assert util.cache_dir == folders.user_cache_env
 
-def test_timeit():
+def test_timeit(mocker: 'MockerFixture'):
+    # drive the timer from a fake clock instead of sleeping: the test is
+    # deterministic and doesn't add real wall time to the suite
+    fake_clock = iter([0.0, 0.25, 0.75, 0.75])
+    mocker.patch("at.utils.time.perf_counter", side_effect=fake_clock)
+
     # the clock starts as soon as the class is initialized
     timer = Timeit()
-    time.sleep(0.15)
     timer.interval()  # record an interval
 
-    # Timeit class uses time.perf_counter, which doesn't play nice with time.sleep
-    # inside of pytest. we have to make our assert tolerances extremely sloppy
-    # to account for that.
-    # outside of pytest, this issue is difficult to replicate
-    assert 0.149 < timer.float < 0.156
-    assert timer.str.startswith("0.149") or timer.str.startswith("0.15")
-
+    assert timer.float == 0.25
+    assert timer.str == "0.2500s"
 
-    time.sleep(0.05)
     timer.interval()
 
     # only the time elapsed since the start
     # of the last interval is recorded
-    assert 0.049 < timer.float < 0.056
-    assert timer.str.startswith("0.049") or timer.str.startswith("0.05")
+    assert timer.float == 0.5
+    assert timer.str == "0.5000s"
 
     # timer.interval() is the same as timer.stop() except it starts a new
     # clock immediately after recording runtime for the previous clock
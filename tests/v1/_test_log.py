@@ -26,7 +26,7 @@ def test_configure_logging(
 
     # logging by default is a no-op, unless and until logging is enabled.
     # no log file should exist yet
-    assert len(list(tmp_path.iterdir())) == 0
+    assert not tmp_path.joinpath("test.log").exists()
     configure_logging(
         app_name="test",
         stderr_level="DEBUG",
@@ -38,7 +38,7 @@ def test_configure_logging(
     caploguru_manual.add_handler()
     # test basic configuration
     logger.info("When `logfile_level` is None, no file logging should occur")
-    assert len(list(tmp_path.iterdir())) == 0
+    assert not tmp_path.joinpath("test.log").exists()
 
     # test sys.stderr sink
     assert (